@@ -0,0 +1,6 @@
+"""ETL pipeline for the Data Careers training dashboards.
+
+Loads the raw Zoom attendance exports, labs/quizzes workbooks,
+participation records and learner status files, cleans them, and
+produces the fact/dimension tables imported into Power BI.
+"""
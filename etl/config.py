@@ -0,0 +1,68 @@
+"""Filesystem and threshold configuration for the ETL pipeline.
+
+Paths default to the AWSCloud Training cohort but can be pointed at any
+cohort directory (e.g. "PowerBI Training") via environment variables.
+
+The resolved settings live on a frozen Config built once per process by
+get_config(); the historical module-level constants (ZOOM_DIR, ...) are
+served lazily from it via the module __getattr__, so importing this
+module no longer walks the environment or the data directory.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _single_xlsx(folder):
+    """Return the one workbook in ``folder`` (names differ per cohort)."""
+    matches = sorted(folder.glob("*.xlsx"))
+    return matches[0] if matches else folder / f"{folder.name}.xlsx"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Resolved pipeline settings; immutable and picklable for workers."""
+
+    data_dir: Path
+    output_dir: Path
+    zoom_dir: Path
+    labs_quizzes_file: Path
+    participation_file: Path
+    status_file: Path
+    # Output format for the fact/dim tables: "parquet" (zstd-compressed,
+    # read natively by Power BI's Parquet connector) or "csv".
+    output_format: str
+    # Minutes in a session below which a learner is not counted as attending.
+    min_attendance_minutes: int
+    # Cohort metadata stamped onto dim_learner.
+    cohort: str
+    track: str
+
+
+@cache
+def get_config():
+    """Build the Config from the environment, once per process."""
+    data_dir = Path(os.getenv("ETL_DATA_DIR", str(PROJECT_ROOT / "data" / "AWSCloud Training")))
+    return Config(
+        data_dir=data_dir,
+        output_dir=Path(os.getenv("ETL_OUTPUT_DIR", str(PROJECT_ROOT / "output"))),
+        zoom_dir=data_dir / "Zoom Attendance",
+        labs_quizzes_file=_single_xlsx(data_dir / "Labs & Quizes"),
+        participation_file=_single_xlsx(data_dir / "Participation"),
+        status_file=_single_xlsx(data_dir / "Status of Learners"),
+        output_format=os.getenv("ETL_OUTPUT_FORMAT", "parquet"),
+        min_attendance_minutes=int(os.getenv("ETL_MIN_ATTENDANCE_MINUTES", "30")),
+        cohort=os.getenv("ETL_COHORT", "2024-Q3"),
+        track=os.getenv("ETL_TRACK", data_dir.name.replace(" Training", "")),
+    )
+
+
+def __getattr__(name):
+    """Serve the historical UPPER_CASE constants from the cached Config."""
+    if name.isupper() and name.lower() in Config.__dataclass_fields__:
+        return getattr(get_config(), name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,115 @@
+"""Loaders for the raw source files.
+
+Excel sources are read with the Rust-backed calamine engine when
+python-calamine is installed, falling back to openpyxl so the pipeline
+still runs in environments without the optional dependency. The Zoom
+CSVs are read in parallel through pyarrow, which releases the GIL while
+parsing.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
+
+from etl.config import LABS_QUIZZES_FILE, PARTICIPATION_FILE, STATUS_FILE, ZOOM_DIR
+
+
+def _read_excel(path, sheet_name=0, **kwargs):
+    """Read a single sheet, preferring the calamine engine."""
+    kwargs.setdefault("dtype_backend", "pyarrow")
+    try:
+        return pd.read_excel(path, sheet_name=sheet_name, engine="calamine", **kwargs)
+    except ImportError:
+        return pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl", **kwargs)
+
+
+def _assessment_columns(name):
+    """Keep only the email key and the per-week score columns."""
+    return name == "email" or name.startswith("Week")
+
+
+def _open_workbook(path):
+    """Open a workbook once so multiple sheets share a single parse."""
+    try:
+        return pd.ExcelFile(path, engine="calamine")
+    except ImportError:
+        return pd.ExcelFile(path, engine="openpyxl")
+
+
+def load_labs(path=LABS_QUIZZES_FILE):
+    """Load the wide Labs sheet (one week-column per lab score)."""
+    return _read_excel(
+        path, sheet_name="Labs", usecols=_assessment_columns, dtype={"email": "string"}
+    )
+
+
+def load_quizzes(path=LABS_QUIZZES_FILE):
+    """Load the wide Quizzes sheet (one week-column per quiz score)."""
+    return _read_excel(
+        path, sheet_name="Quizzes", usecols=_assessment_columns, dtype={"email": "string"}
+    )
+
+
+def load_labs_and_quizzes(path=LABS_QUIZZES_FILE):
+    """Load both assessment sheets while parsing the workbook only once.
+
+    Returns a (labs_df, quizzes_df) tuple.
+    """
+    with _open_workbook(path) as workbook:
+        return (
+            workbook.parse(
+                "Labs",
+                usecols=_assessment_columns,
+                dtype={"email": "string"},
+                dtype_backend="pyarrow",
+            ),
+            workbook.parse(
+                "Quizzes",
+                usecols=_assessment_columns,
+                dtype={"email": "string"},
+                dtype_backend="pyarrow",
+            ),
+        )
+
+
+def load_participation(path=PARTICIPATION_FILE):
+    """Load the participation records (Date, comma-separated Participants)."""
+    return _read_excel(path, usecols=["Date", "Participants"], dtype="string")
+
+
+def load_status(path=STATUS_FILE):
+    """Load the learner graduation/certification status sheet."""
+    return _read_excel(
+        path,
+        usecols=["email", "Graduation Status", "Certification Status"],
+        dtype="string",
+    )
+
+
+def _read_zoom_csv(file):
+    """Read one daily export into an Arrow table tagged with its origin."""
+    table = pa.csv.read_csv(file)
+    n_rows = table.num_rows
+    table = table.append_column("source_file", pa.array([file.name] * n_rows))
+    table = table.append_column("source_path", pa.array([str(file)] * n_rows))
+    return table
+
+
+def load_zoom_attendance(zoom_dir=ZOOM_DIR):
+    """Load every daily Zoom attendance CSV under ``zoom_dir``.
+
+    Each record keeps its source file name and path so the transforms can
+    recover the session date and week number from the folder structure.
+    The many small files make this phase I/O latency-bound, so they are
+    read concurrently and concatenated once at the Arrow level instead of
+    through N pandas frames.
+    """
+    all_files = sorted(zoom_dir.glob("**/*.csv"))
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        tables = list(pool.map(_read_zoom_csv, all_files))
+    combined = pa.concat_tables(tables, promote_options="permissive")
+    return combined.to_pandas(types_mapper=pd.ArrowDtype)
@@ -0,0 +1,56 @@
+"""Optional Polars lazy engine for the Zoom attendance path.
+
+Only imported when the pipeline is run with --engine=polars, so polars
+stays an optional dependency. The whole load+transform is expressed as
+one LazyFrame: the query planner fuses the projections, string kernels
+and filters into a single streaming pass over the scanned CSVs instead
+of materialising the raw table.
+"""
+
+import polars as pl
+
+from etl.config import MIN_ATTENDANCE_MINUTES, ZOOM_DIR
+
+_DURATION_RE = r"(?<h>\d+):(?<m>\d+):(?<s>\d+)"
+
+
+def build_fact_attendance(zoom_dir=ZOOM_DIR):
+    """Scan every daily Zoom CSV and build fact_attendance lazily."""
+    lf = pl.scan_csv(
+        str(zoom_dir / "**" / "*.csv"),
+        include_file_paths="source_path",
+        infer_schema_length=None,
+    )
+
+    duration = pl.col("Duration").cast(pl.String).str.strip_chars()
+    clock = duration.str.extract_groups(_DURATION_RE)
+    duration_minutes = (
+        clock.struct.field("h").cast(pl.Float64) * 60
+        + clock.struct.field("m").cast(pl.Float64)
+        + clock.struct.field("s").cast(pl.Float64) / 60
+    ).fill_null(duration.cast(pl.Float64, strict=False))
+
+    email = pl.col("Email").str.to_lowercase().str.strip_chars()
+    attendance_date = (
+        pl.col("source_path")
+        .str.extract(r"(\d{2}-\w{3}-\d{4})\.csv$")
+        .str.strptime(pl.Date, "%d-%b-%Y")
+    )
+
+    lf = lf.select(
+        attendance_id=pl.int_range(1, pl.len() + 1, dtype=pl.Int64),
+        email=email,
+        learner_name=pl.col("Name").str.strip_chars(),
+        attendance_date=attendance_date,
+        week_number=pl.col("source_path").str.extract(r"Week (\d+)").cast(pl.Int8),
+        duration_minutes=duration_minutes,
+        attended=duration_minutes >= MIN_ATTENDANCE_MINUTES,
+    )
+    return lf.collect(engine="streaming")
+
+
+def fact_attendance_to_pandas(zoom_dir=ZOOM_DIR):
+    """Collect the lazy attendance fact and match the pandas engine's dtypes."""
+    df = build_fact_attendance(zoom_dir).to_pandas()
+    df["attendance_date"] = df["attendance_date"].astype("datetime64[ns]")
+    return df.astype({"email": "category", "learner_name": "category", "week_number": "int8"})
@@ -0,0 +1,325 @@
+"""Transforms that turn the raw source tables into fact/dim tables.
+
+Column conventions for the outputs match the Power BI model described in
+the README: facts carry an integer surrogate key, a lowercase ``email``
+join key, and a date column typed as datetime64.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:  # optional accelerator; the pandas path is used instead
+    numba = None
+
+from etl.config import COHORT, MIN_ATTENDANCE_MINUTES, TRACK
+from etl.utils import parse_duration_to_minutes
+
+
+# Compiled once at import so repeated calls reuse one re.Pattern. The
+# named group is required by Arrow-backed string columns, whose RE2
+# kernel only accepts the raw pattern text (hence ``.pattern`` below).
+_WEEK_RE = re.compile(r"Week (?P<week>\d+)")
+_DATE_FMT = "%d-%b-%Y"
+
+
+def extract_week_from_paths(path_series):
+    """Pull the week number out of ".../Week N/<file>.csv" paths."""
+    return path_series.str.extract(_WEEK_RE.pattern, expand=False).astype(int)
+
+
+def extract_date_from_filenames(file_series):
+    """Parse session dates from "DD-Mon-YYYY.csv" file names.
+
+    cache=True reuses parsed values: each file name recurs once per
+    attendance row, so only a handful of distinct strings are ever parsed.
+    """
+    return pd.to_datetime(file_series.str.replace(".csv", ""), format=_DATE_FMT, cache=True)
+
+
+def transform_zoom_attendance(zoom_df):
+    """Build fact_attendance from the combined Zoom exports.
+
+    The result is assembled from fresh column expressions rather than a
+    copy of the raw frame, so the unused raw columns are never duplicated.
+    """
+    email = zoom_df["Email"].str.lower().str.strip()
+    attendance_date = extract_date_from_filenames(zoom_df["source_file"])
+    duration_minutes = parse_duration_to_minutes(zoom_df["Duration"])
+    result = pd.DataFrame(
+        {
+            # Integer surrogate key like the other facts; the old
+            # email+"_"+strftime concat allocated a string per row.
+            "attendance_id": np.arange(1, len(zoom_df) + 1, dtype=np.int64),
+            "email": email,
+            "learner_name": zoom_df["Name"].str.strip(),
+            "attendance_date": attendance_date,
+            "week_number": extract_week_from_paths(zoom_df["source_path"]),
+            "duration_minutes": duration_minutes,
+            "attended": duration_minutes >= MIN_ATTENDANCE_MINUTES,
+        }
+    )
+    # Emails and names repeat once per session; categorical codes keep the
+    # table compact and make the downstream groupbys integer-keyed.
+    return result.astype(
+        {"email": "category", "learner_name": "category", "week_number": "int8"}
+    )
+
+
+def create_name_email_mapping(attendance_df):
+    """Unique learner_name/email pairs from the attendance records.
+
+    Returned as a two-column DataFrame (both categorical) so callers can
+    resolve names with a C-level hash join instead of a Python dict.
+    """
+    unique = attendance_df[["learner_name", "email"]].drop_duplicates("learner_name")
+    return unique.reset_index(drop=True)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _match_participants(flat_names, offsets, lookup):
+        """Match stripped names against ``lookup``, emitting matched pairs.
+
+        Returns (session_idx, lookup_pos) int64 arrays, one entry per
+        matched name, in input order. Runs in nopython mode so the
+        variable-length per-session lists cost no Python object churn.
+        """
+        n = len(flat_names)
+        session_idx = np.empty(n, dtype=np.int64)
+        lookup_pos = np.empty(n, dtype=np.int64)
+        count = 0
+        session = 0
+        for i in range(n):
+            while session + 1 < len(offsets) and i >= offsets[session + 1]:
+                session += 1
+            name = flat_names[i].strip()
+            if name in lookup:
+                session_idx[count] = session
+                lookup_pos[count] = lookup[name]
+                count += 1
+        return session_idx[:count], lookup_pos[:count]
+
+
+def _explode_participants_numba(dates, name_lists, name_email_df):
+    """Numba path: one compiled pass over the flattened name lists."""
+    flat_names = numba.typed.List([name for names in name_lists for name in names])
+    offsets = np.zeros(len(name_lists) + 1, dtype=np.int64)
+    np.cumsum([len(names) for names in name_lists], out=offsets[1:])
+
+    lookup = numba.typed.Dict.empty(numba.types.unicode_type, numba.types.int64)
+    for pos, name in enumerate(name_email_df["learner_name"].astype(str)):
+        lookup[name] = pos
+
+    session_idx, lookup_pos = _match_participants(flat_names, offsets, lookup)
+    return pd.DataFrame(
+        {
+            "email": name_email_df["email"].to_numpy()[lookup_pos],
+            "learner_name": name_email_df["learner_name"].to_numpy()[lookup_pos],
+            "participation_date": dates.to_numpy()[session_idx],
+        }
+    )
+
+
+def _explode_participants(dates, name_lists, name_email_df):
+    """Pandas path: explode, then resolve emails with one indexer gather.
+
+    Index.get_indexer maps every stripped name to its row in the mapping
+    table in a single C call; unmatched names come back as -1 and are
+    masked out, replacing both the per-row hash lookups of a map/merge
+    and the separate dropna scan.
+    """
+    exploded = pd.DataFrame(
+        {"participation_date": dates, "learner_name": name_lists}
+    ).explode("learner_name")
+    name_index = pd.Index(name_email_df["learner_name"].astype(str))
+    positions = name_index.get_indexer(exploded["learner_name"].str.strip())
+    mask = positions >= 0
+    matched = positions[mask]
+    return pd.DataFrame(
+        {
+            "email": name_email_df["email"].to_numpy()[matched],
+            "learner_name": name_email_df["learner_name"].to_numpy()[matched],
+            "participation_date": exploded["participation_date"].to_numpy()[mask],
+        }
+    )
+
+
+def transform_participation(participation_df, name_email_df):
+    """Build fact_participation: one row per learner per session date.
+
+    The raw sheet stores a whole session as one row with a comma-separated
+    Participants cell; names without a known email are dropped. The split
+    lists have irregular per-row lengths, so when numba is installed the
+    match runs as a compiled kernel instead of explode+merge.
+    """
+    dates = pd.to_datetime(participation_df["Date"], format=_DATE_FMT, cache=True)
+    # A blank Participants cell would split to NA instead of a list and
+    # crash the flatten in the numba path; treat it as an empty roster.
+    name_lists = participation_df["Participants"].fillna("").str.split(",")
+    if numba is not None:
+        result = _explode_participants_numba(dates, name_lists, name_email_df)
+    else:
+        result = _explode_participants(dates, name_lists, name_email_df)
+    result.insert(0, "participation_id", np.arange(1, len(result) + 1, dtype=np.int64))
+    result = result[["participation_id", "email", "learner_name", "participation_date"]]
+    return result.astype({"email": "category", "learner_name": "category"})
+
+
+def transform_assessments(labs_df, quizzes_df):
+    """Build fact_assessment by unpivoting the wide Labs/Quizzes sheets.
+
+    The two melted halves are written into pre-sized arrays rather than
+    joined with pd.concat, which would copy both into a third full-size
+    buffer at the memory peak of Phase 2.
+    """
+    labs = labs_df.melt(id_vars="email", var_name="week", value_name="score")
+    quizzes = quizzes_df.melt(id_vars="email", var_name="week", value_name="score")
+    n_labs, n_total = len(labs), len(labs) + len(quizzes)
+
+    email = np.empty(n_total, dtype=object)
+    email[:n_labs] = labs["email"].to_numpy()
+    email[n_labs:] = quizzes["email"].to_numpy()
+
+    week = np.empty(n_total, dtype=object)
+    week[:n_labs] = labs["week"].to_numpy()
+    week[n_labs:] = quizzes["week"].to_numpy()
+
+    labs_scores = labs["score"].to_numpy()
+    quizzes_scores = quizzes["score"].to_numpy()
+    score = np.empty(n_total, dtype=np.result_type(labs_scores, quizzes_scores))
+    score[:n_labs] = labs_scores
+    score[n_labs:] = quizzes_scores
+
+    assessment_type = pd.Categorical.from_codes(
+        np.repeat(np.array([0, 1], dtype=np.int8), [n_labs, n_total - n_labs]),
+        categories=["Lab", "Quiz"],
+    )
+
+    return pd.DataFrame(
+        {
+            "assessment_id": np.arange(1, n_total + 1, dtype=np.int64),
+            "email": pd.Series(email, dtype="string").str.lower().str.strip().astype("category"),
+            "week_number": extract_week_from_paths(pd.Series(week, dtype="string")).astype(np.int8),
+            "assessment_type": assessment_type,
+            "score": score,
+        }
+    )
+
+
+def create_dim_learner(status_df, attendance_df):
+    """Build dim_learner from the status sheet enriched with attendance.
+
+    Only the three status columns are pulled into the new frame; copying
+    the whole sheet just to discard most of it doubled peak memory.
+    """
+    df = pd.DataFrame(
+        {
+            "email": status_df["email"].str.lower().str.strip(),
+            "graduated": status_df["Graduation Status"].eq("Graduate"),
+            "certified": status_df["Certification Status"].eq("Certified"),
+        }
+    )
+
+    first_seen = attendance_df.groupby("email").agg(
+        learner_name=("learner_name", "first"),
+        enrollment_date=("attendance_date", "min"),
+    )
+    df = df.merge(first_seen, on="email", how="left")
+
+    df["cohort"] = COHORT
+    df["track"] = TRACK
+    df["current_status"] = np.where(
+        df["graduated"] & df["certified"],
+        "Certified Graduate",
+        np.where(df["graduated"], "Graduate", "In Progress"),
+    )
+    return df[
+        [
+            "email",
+            "learner_name",
+            "enrollment_date",
+            "cohort",
+            "track",
+            "graduated",
+            "certified",
+            "current_status",
+        ]
+    ]
+
+
+_MONTH_NAMES = np.array(
+    ["January", "February", "March", "April", "May", "June", "July",
+     "August", "September", "October", "November", "December"]
+)
+_DAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+)
+
+
+def create_dim_date(fact_attendance, fact_participation):
+    """Build a daily dim_date covering every date seen in the facts.
+
+    The calendar components are derived with datetime64 arithmetic on one
+    numpy day-resolution array (plus name lookups by index) rather than a
+    chain of .dt accessors that each rescan the DatetimeIndex, and the
+    frame is assembled once from compact int8/int16 arrays.
+    """
+    # Both fact columns are already datetime64 after the transforms; the
+    # calendar bounds are just two scalar reductions per column, with no
+    # need to concat, re-parse, dedup or sort the full facts.
+    att_dates = fact_attendance["attendance_date"]
+    part_dates = fact_participation["participation_date"]
+    date_range = pd.date_range(
+        min(att_dates.min(), part_dates.min()),
+        max(att_dates.max(), part_dates.max()),
+        freq="D",
+    )
+
+    days = date_range.to_numpy().astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    year = (days.astype("datetime64[Y]").astype(np.int64) + 1970).astype(np.int16)
+    month = ((months.astype(np.int64) % 12) + 1).astype(np.int8)
+    day = ((days - months).astype(np.int64) + 1).astype(np.int8)
+    # Epoch day 0 (1970-01-01) was a Thursday; Monday == 0.
+    day_of_week = ((days.astype(np.int64) + 3) % 7).astype(np.int8)
+    iso_week = date_range.isocalendar().week.to_numpy(dtype=np.int8)
+
+    return pd.DataFrame(
+        {
+            "date": date_range,
+            "year": year,
+            "month": month,
+            "month_name": _MONTH_NAMES[month - 1],
+            "day": day,
+            "day_name": _DAY_NAMES[day_of_week],
+            "day_of_week": day_of_week,
+            "iso_week": iso_week,
+            "is_weekend": np.isin(day_of_week, np.array([5, 6], dtype=np.int8)),
+        }
+    )
+
+
+def create_dim_week(fact_attendance):
+    """Build dim_week (start/end dates and a label per training week).
+
+    With only ~10 weeks a groupby with two reducers is overkill: one sort
+    plus first/last dedup per week gives the same min/max dates without
+    building a groupby hash table over the whole fact.
+    """
+    sorted_att = fact_attendance[["week_number", "attendance_date"]].sort_values(
+        ["week_number", "attendance_date"]
+    )
+    week_start = sorted_att.drop_duplicates("week_number", keep="first").rename(
+        columns={"attendance_date": "week_start"}
+    )
+    week_end = sorted_att.drop_duplicates("week_number", keep="last").rename(
+        columns={"attendance_date": "week_end"}
+    )
+    weeks = week_start.merge(week_end, on="week_number").reset_index(drop=True)
+    weeks["week_label"] = "Week " + weeks["week_number"].astype(str)
+    return weeks
@@ -0,0 +1,24 @@
+"""Small shared helpers for the ETL transforms."""
+
+import numpy as np
+import pandas as pd
+
+# Clock-style Zoom duration ("1:46:00"); named groups so the pattern also
+# works on Arrow-backed string columns.
+_DURATION_RE = r"(?P<h>\d+):(?P<m>\d+):(?P<s>\d+)"
+
+
+def parse_duration_to_minutes(duration_series):
+    """Convert a Series of Zoom durations to minutes as float64.
+
+    Zoom exports durations either as plain minutes ("66") or as a
+    clock-style "H:MM:SS" string ("1:46:00") depending on the account's
+    report settings; both cohorts appear in our data. The whole column is
+    parsed with one C-level regex scan plus numpy arithmetic instead of a
+    per-row Python function.
+    """
+    text = duration_series.astype("string").str.strip()
+    hms = text.str.extract(_DURATION_RE).to_numpy(dtype=np.float64)
+    minutes = hms[:, 0] * 60 + hms[:, 1] + hms[:, 2] / 60.0
+    plain = pd.to_numeric(text, errors="coerce").to_numpy(dtype=np.float64)
+    return np.where(np.isnan(minutes), plain, minutes)
@@ -0,0 +1,146 @@
+"""Entry point: run the full ETL and write the Power BI input tables."""
+
+import argparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Store strings in Arrow buffers instead of object arrays so the
+# .str.lower/.strip/.split chains in the transforms dispatch to Arrow's
+# vectorized kernels. Default from pandas 3; opt-in (and eventually
+# removed) on the 2.x series, hence the guard.
+try:
+    pd.set_option("future.infer_string", True)
+except pd.errors.OptionError:
+    pass
+
+from etl.config import OUTPUT_DIR, OUTPUT_FORMAT, PARTICIPATION_FILE, STATUS_FILE, ZOOM_DIR
+from etl.loaders import (
+    load_labs_and_quizzes,
+    load_participation,
+    load_status,
+    load_zoom_attendance,
+)
+from etl.transformers import (
+    create_dim_date,
+    create_dim_learner,
+    create_dim_week,
+    create_name_email_mapping,
+    transform_assessments,
+    transform_participation,
+    transform_zoom_attendance,
+)
+
+
+def save_dataframe(df, filepath, index=False, format=OUTPUT_FORMAT):
+    """Write one output table for import into Power BI.
+
+    Parquet (zstd, columnar) is the default: files are several times
+    smaller than CSV and pyarrow writes column buffers with the GIL
+    released. CSV remains available for tools without Parquet support.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if format == "parquet":
+        filepath = filepath.with_suffix(".parquet")
+        df.to_parquet(filepath, engine="pyarrow", compression="zstd", index=index)
+    else:
+        filepath = filepath.with_suffix(".csv")
+        df.to_csv(filepath, index=index)
+    print(f"  wrote {filepath} ({len(df)} rows)")
+
+
+def save_partitioned(df, dirpath, partition_cols=("week_number",)):
+    """Write a fact table as a Parquet dataset partitioned by week.
+
+    One folder per week lets Power BI refresh weeks incrementally, and
+    pyarrow writes the partitions on its internal thread pool with the
+    GIL released.
+    """
+    ds.write_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        dirpath,
+        format="parquet",
+        partitioning=list(partition_cols),
+        partitioning_flavor="hive",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_file=1_000_000,
+        max_rows_per_group=1_000_000,
+    )
+    print(f"  wrote {dirpath}/ partitioned by {', '.join(partition_cols)} ({len(df)} rows)")
+
+
+# Each fact is built by a helper that loads and transforms in one scope,
+# so the raw DataFrame becomes unreachable (and collectible) the moment
+# the helper returns instead of living until the end of run_pipeline.
+
+
+def _build_fact_attendance(engine):
+    """Load and transform the Zoom exports with the selected engine.
+
+    With polars the load and transform fuse into one lazy query; the
+    result is converted back to pandas so the rest of the pipeline is
+    engine-agnostic.
+    """
+    if engine == "polars":
+        from etl import polars_engine
+
+        return polars_engine.fact_attendance_to_pandas(ZOOM_DIR)
+    return transform_zoom_attendance(load_zoom_attendance(ZOOM_DIR))
+
+
+def _build_fact_participation(name_email_df):
+    """Load and explode the participation records."""
+    return transform_participation(load_participation(PARTICIPATION_FILE), name_email_df)
+
+
+def _build_fact_assessment():
+    """Load and unpivot the labs/quizzes workbook."""
+    labs_raw, quizzes_raw = load_labs_and_quizzes()
+    return transform_assessments(labs_raw, quizzes_raw)
+
+
+def _build_dim_learner(fact_attendance):
+    """Load the status sheet and derive the learner dimension."""
+    return create_dim_learner(load_status(STATUS_FILE), fact_attendance)
+
+
+def run_pipeline(engine="pandas"):
+    """Load, transform, and write every fact and dimension table."""
+    print("Phase 1: building fact tables")
+    fact_attendance = _build_fact_attendance(engine)
+    name_email_df = create_name_email_mapping(fact_attendance)
+    fact_participation = _build_fact_participation(name_email_df)
+    fact_assessment = _build_fact_assessment()
+
+    print("Phase 2: building dimension tables")
+    dim_learner = _build_dim_learner(fact_attendance)
+    dim_date = create_dim_date(fact_attendance, fact_participation)
+    dim_week = create_dim_week(fact_attendance)
+
+    print("Phase 3: writing outputs")
+    if OUTPUT_FORMAT == "parquet":
+        # The week-keyed facts become partitioned datasets; the other
+        # tables are small enough that a single file is simpler.
+        save_partitioned(fact_attendance, OUTPUT_DIR / "fact_attendance")
+        save_partitioned(fact_assessment, OUTPUT_DIR / "fact_assessment")
+    else:
+        save_dataframe(fact_attendance, OUTPUT_DIR / "fact_attendance.csv")
+        save_dataframe(fact_assessment, OUTPUT_DIR / "fact_assessment.csv")
+    save_dataframe(fact_participation, OUTPUT_DIR / "fact_participation.csv")
+    save_dataframe(dim_learner, OUTPUT_DIR / "dim_learner.csv")
+    save_dataframe(dim_date, OUTPUT_DIR / "dim_date.csv")
+    save_dataframe(dim_week, OUTPUT_DIR / "dim_week.csv")
+    print("Done.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Power BI input tables.")
+    parser.add_argument(
+        "--engine",
+        choices=["pandas", "polars"],
+        default="pandas",
+        help="DataFrame engine for the Zoom attendance path (polars is optional).",
+    )
+    args = parser.parse_args()
+    run_pipeline(engine=args.engine)